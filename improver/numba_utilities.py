@@ -0,0 +1,70 @@
+# (C) Crown Copyright, Met Office. All rights reserved.
+#
+# This file is part of 'IMPROVER' and is released under the BSD 3-Clause license.
+# See LICENSE in the root of the repository for full licensing details.
+"""
+This module defines the optional numba utilities for thresholding plugins.
+"""
+
+import os
+
+import numpy as np
+from numba import config, njit, prange, set_num_threads
+
+config.THREADING_LAYER = "omp"
+if "OMP_NUM_THREADS" in os.environ:
+    set_num_threads(int(os.environ["OMP_NUM_THREADS"]))
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def fast_fuzzy_truth_values(
+    data: np.ndarray,
+    thresholds: np.ndarray,
+    lower_bounds: np.ndarray,
+    upper_bounds: np.ndarray,
+    invert: bool,
+) -> np.ndarray:
+    """For each threshold, scale the data values linearly between a truth
+    value of 0 at the lower fuzzy bound and 1 at the upper fuzzy bound, with
+    a value of 0.5 where the data equals the threshold. If invert is True
+    the ramp endpoints are flipped, scaling from 1 at the lower bound to 0
+    at the upper bound, fusing the below-threshold inversion into the ramp
+    rather than requiring a second pass over the truth values.
+
+    Args:
+        data: 1-D array of diagnostic values
+        thresholds: 1-D array of threshold values
+        lower_bounds: 1-D array of lower fuzzy bounds, one per threshold
+        upper_bounds: 1-D array of upper fuzzy bounds, one per threshold
+        invert: whether to invert the ramp for below-threshold probabilities
+    Returns:
+        2-D array with shape (len(thresholds), len(data)) containing the
+            truth values for each threshold
+    """
+    start = 1.0 if invert else 0.0
+    end = 1.0 - start
+    result = np.empty((thresholds.shape[0], data.shape[0]), dtype=np.float32)
+    for index in range(thresholds.shape[0]):
+        threshold = thresholds[index]
+        lower = lower_bounds[index]
+        upper = upper_bounds[index]
+        if lower == upper:
+            # Thresholds with coincident fuzzy bounds are deterministic; the
+            # caller overwrites these values with a 0/1 probability, so avoid
+            # dividing by zero here and return a placeholder.
+            result[index, :] = 0.0
+            continue
+        lower_scale = (0.5 - start) / (threshold - lower)
+        upper_scale = (end - 0.5) / (upper - threshold)
+        for point in prange(data.shape[0]):
+            value = data[point]
+            if value < threshold:
+                probability = start + (value - lower) * lower_scale
+            else:
+                probability = 0.5 + (value - threshold) * upper_scale
+            if probability < 0.0:
+                probability = 0.0
+            elif probability > 1.0:
+                probability = 1.0
+            result[index, point] = probability
+    return result
@@ -5,6 +5,7 @@
 """Module containing thresholding classes."""
 
 import numbers
+import warnings
 from collections.abc import Iterable
 from typing import Dict, List, Optional, Tuple, Union
 
@@ -24,7 +25,6 @@ from improver.metadata.probabilistic import (
 )
 from improver.utilities.cube_manipulation import enforce_coordinate_ordering
 from improver.utilities.probability_manipulation import comparison_operator_dict
-from improver.utilities.rescale import rescale
 from improver.utilities.spatial import (
     create_vicinity_coord,
     distance_to_number_of_grid_cells,
@@ -33,6 +33,109 @@ from improver.utilities.spatial import (
 )
 
 
+def _slow_fuzzy_truth_values(
+    data: np.ndarray,
+    thresholds: np.ndarray,
+    lower_bounds: np.ndarray,
+    upper_bounds: np.ndarray,
+    invert: bool = False,
+) -> np.ndarray:
+    """For each threshold, scale the data values linearly between a truth
+    value of 0 at the lower fuzzy bound and 1 at the upper fuzzy bound, with
+    a value of 0.5 where the data equals the threshold. If invert is True
+    the ramp endpoints are flipped, scaling from 1 at the lower bound to 0
+    at the upper bound, fusing the below-threshold inversion into the ramp
+    rather than requiring a second pass over the truth values.
+
+    Args:
+        data: array of diagnostic values
+        thresholds: 1-D array of threshold values
+        lower_bounds: 1-D array of lower fuzzy bounds, one per threshold
+        upper_bounds: 1-D array of upper fuzzy bounds, one per threshold
+        invert: whether to invert the ramp for below-threshold probabilities
+    Returns:
+        Array with a leading threshold dimension prepended to the data shape,
+            containing the truth values for each threshold
+    """
+    start = 1.0 if invert else 0.0
+    end = 1.0 - start
+    broadcast_shape = (-1,) + (1,) * data.ndim
+    thresholds = thresholds.reshape(broadcast_shape)
+    lower_bounds = lower_bounds.reshape(broadcast_shape)
+    upper_bounds = upper_bounds.reshape(broadcast_shape)
+    result_shape = (thresholds.shape[0],) + data.shape
+    result_dtype = np.result_type(data, thresholds)
+    # Any divisions by zero here belong to thresholds with coincident fuzzy
+    # bounds; these values are overwritten with a deterministic probability
+    # by the caller.
+    with np.errstate(divide="ignore", invalid="ignore"):
+        lower_scale = (0.5 - start) / (thresholds - lower_bounds)
+        upper_scale = (end - 0.5) / (upper_bounds - thresholds)
+
+        # Each ramp segment is clipped to its own half of the truth value
+        # range, with the two halves meeting at 0.5 at the threshold, so the
+        # full ramp is the sum of the segments less the shared 0.5. In-place
+        # ufuncs build each segment in a preallocated buffer, avoiding the
+        # temporaries a single broadcast expression would allocate.
+        below = np.empty(result_shape, dtype=result_dtype)
+        np.subtract(data[np.newaxis], lower_bounds, out=below)
+        np.multiply(below, lower_scale, out=below)
+        np.add(below, start, out=below)
+        np.clip(below, min(start, 0.5), max(start, 0.5), out=below)
+
+        above = np.empty(result_shape, dtype=result_dtype)
+        np.subtract(data[np.newaxis], thresholds, out=above)
+        np.multiply(above, upper_scale, out=above)
+        np.add(above, 0.5, out=above)
+        np.clip(above, min(end, 0.5), max(end, 0.5), out=above)
+
+        np.add(below, above, out=below)
+        np.subtract(below, 0.5, out=below)
+    return below
+
+
+def _fuzzy_truth_values(
+    data: np.ndarray,
+    thresholds: np.ndarray,
+    lower_bounds: np.ndarray,
+    upper_bounds: np.ndarray,
+    invert: bool = False,
+) -> np.ndarray:
+    """For each threshold, scale the data values linearly between a truth
+    value of 0 at the lower fuzzy bound and 1 at the upper fuzzy bound, with
+    a value of 0.5 where the data equals the threshold. If invert is True
+    the ramp is flipped, scaling from 1 at the lower bound to 0 at the
+    upper bound.
+
+    Calls a fast numba implementation where numba is available (see
+    `improver.numba_utilities.fast_fuzzy_truth_values`) and calls the native
+    python implementation otherwise (see :func:`_slow_fuzzy_truth_values`).
+
+    Args:
+        data: array of diagnostic values
+        thresholds: 1-D array of threshold values
+        lower_bounds: 1-D array of lower fuzzy bounds, one per threshold
+        upper_bounds: 1-D array of upper fuzzy bounds, one per threshold
+        invert: whether to invert the ramp for below-threshold probabilities
+    Returns:
+        Array with a leading threshold dimension prepended to the data shape,
+            containing the truth values for each threshold
+    """
+    try:
+        import numba  # noqa: F401
+
+        from improver.numba_utilities import fast_fuzzy_truth_values
+
+        return fast_fuzzy_truth_values(
+            data.reshape(-1), thresholds, lower_bounds, upper_bounds, invert
+        ).reshape((len(thresholds),) + data.shape)
+    except ImportError:
+        warnings.warn("Module numba unavailable. Threshold will be slower.")
+        return _slow_fuzzy_truth_values(
+            data, thresholds, lower_bounds, upper_bounds, invert
+        )
+
+
 class Threshold(PostProcessingPlugin):
     """Apply a threshold truth criterion to a cube.
 
@@ -190,10 +293,39 @@ class Threshold(PostProcessingPlugin):
             )
             self._check_fuzzy_bounds()
 
+        # Precompute the thresholds and fuzzy bounds as arrays ready for
+        # broadcasting against the diagnostic data in process; thresholds
+        # with coincident bounds are thresholded deterministically.
+        # Deterministic comparisons retain the full float64 threshold
+        # precision, whilst the fuzzy ramp is calculated at the default
+        # float precision to halve its memory traffic.
+        self._thresholds = np.array(self.thresholds)
+        lower_bounds, upper_bounds = (
+            np.array(bounds) for bounds in zip(*self.fuzzy_bounds)
+        )
+        self._deterministic = lower_bounds == upper_bounds
+        self._fuzzy_thresholds = self._thresholds.astype(FLOAT_DTYPE)
+        self._lower_bounds = lower_bounds.astype(FLOAT_DTYPE)
+        self._upper_bounds = upper_bounds.astype(FLOAT_DTYPE)
+
+        # A fuzzy bound that coincides with its threshold gives a fuzzy ramp
+        # segment of zero width. Record the first such threshold here so that
+        # process can raise the same error that rescaling the data would have
+        # done, without rechecking the bounds for every data slice.
+        self._zero_range_threshold = None
+        for threshold, bounds in zip(self.thresholds, self.fuzzy_bounds):
+            if bounds[0] != bounds[1] and threshold in bounds:
+                self._zero_range_threshold = threshold
+                break
+
         self.original_units = None
         self.comparison_operator_dict = comparison_operator_dict()
         self.comparison_operator_string = comparison_operator
         self._decode_comparison_operator_string()
+        # if requirement is for probabilities less_than or
+        # less_than_or_equal_to the threshold (rather than greater_than or
+        # greater_than_or_equal_to), the fuzzy ramp is inverted
+        self._invert_fuzzy = "less_than" in self.comparison_operator.spp_string
 
         if collapse_coord and collapse_coord not in ["percentile", "realization"]:
             raise ValueError(
@@ -351,76 +483,82 @@ class Threshold(PostProcessingPlugin):
         if cube.cell_methods:
             format_cell_methods_for_probability(cube, self.threshold_coord_name)
 
+        relative_to = probability_is_above_or_below(cube)
         cube.rename(
-            "probability_of_{parameter}_{relative_to}_threshold".format(
-                parameter=self.threshold_coord_name,
-                relative_to=probability_is_above_or_below(cube),
-            )
+            f"probability_of_{self.threshold_coord_name}_{relative_to}_threshold"
         )
         cube.units = Unit(1)
 
-    def _calculate_truth_value(
-        self, cube: Cube, threshold: float, bounds: Tuple[float, float]
-    ) -> np.ndarray:
+    def _calculate_truth_value(self, cube: Cube) -> np.ndarray:
         """
-        Compares the diagnostic values to the threshold value, converting units
-        and applying fuzzy bounds as required. Returns the truth value.
+        Compares the diagnostic values to all of the threshold values in a
+        single pass, converting units and applying fuzzy bounds as required.
+        Returns the truth values.
+
+        The thresholds and fuzzy bounds are broadcast against the diagnostic
+        data, adding a leading threshold dimension, such that every threshold
+        is applied without looping over the data in Python.
 
         Args:
             cube:
                 A cube containing the diagnostic values. The cube rather than array
                 is passed in to allow for unit conversion.
-            threshold:
-                A single threshold value against which to compare the diagnostic
-                values.
-            bounds:
-                The fuzzy bounds used for applying fuzzy thresholding.
 
         Returns:
-            truth_value:
-                An array of truth values given by the comparison of the diagnostic
-                data to the threshold value. This is returned at the default float
+            truth_values:
+                An array of truth values, with a leading threshold dimension,
+                given by the comparison of the diagnostic data to each of the
+                threshold values. This is returned at the default float
                 precision.
         """
         if self.threshold_units is not None:
             cube.convert_units(self.threshold_units)
+
+        # The precomputed thresholds and fuzzy bounds broadcast against the
+        # data with a leading threshold dimension.
+        broadcast_shape = (-1,) + (1,) * cube.ndim
+        thresholds = self._thresholds
+        deterministic = self._deterministic
+
         # if upper and lower bounds are equal, set a deterministic 0/1
         # probability based on exceedance of the threshold
-        if bounds[0] == bounds[1]:
-            truth_value = self.comparison_operator.function(cube.data, threshold)
+        if deterministic.all():
+            truth_values = self.comparison_operator.function(
+                cube.data[np.newaxis], thresholds.reshape(broadcast_shape)
+            )
         # otherwise, scale exceedance probabilities linearly between 0/1
         # at the min/max fuzzy bounds and 0.5 at the threshold value
         else:
-            truth_value = np.where(
-                cube.data < threshold,
-                rescale(
-                    cube.data,
-                    data_range=(bounds[0], threshold),
-                    scale_range=(0.0, 0.5),
-                    clip=True,
-                ),
-                rescale(
-                    cube.data,
-                    data_range=(threshold, bounds[1]),
-                    scale_range=(0.5, 1.0),
-                    clip=True,
-                ),
+            # The data are cast to the default float precision for the fuzzy
+            # ramp; this only copies the data if the input is of a different
+            # type, e.g. float64 or an integer type.
+            data = np.ma.getdata(cube.data).astype(FLOAT_DTYPE, copy=False)
+            truth_values = _fuzzy_truth_values(
+                data,
+                self._fuzzy_thresholds,
+                self._lower_bounds,
+                self._upper_bounds,
+                invert=self._invert_fuzzy,
             )
+
+            if deterministic.any():
+                truth_values = np.where(
+                    deterministic.reshape(broadcast_shape),
+                    self.comparison_operator.function(
+                        cube.data[np.newaxis], thresholds.reshape(broadcast_shape)
+                    ),
+                    truth_values,
+                )
+
             # Rescaling exposes masked points so use the rescaled data only in
             # the unmasked locations, set masked locations to 0 and reapply
             # masking.
             if np.ma.is_masked(cube.data):
-                truth_value = np.where(cube.data.mask, 0, truth_value)
-                truth_value = np.ma.masked_array(truth_value, mask=cube.data.mask)
-
-            # if requirement is for probabilities less_than or
-            # less_than_or_equal_to the threshold (rather than
-            # greater_than or greater_than_or_equal_to), invert
-            # the exceedance probability
-            if "less_than" in self.comparison_operator.spp_string:
-                truth_value = 1.0 - truth_value
+                mask = np.broadcast_to(cube.data.mask, truth_values.shape)
+                truth_values = np.where(mask, 0, truth_values)
+                truth_values = np.ma.masked_array(truth_values, mask=mask)
 
-        return truth_value.astype(FLOAT_DTYPE)
+        return truth_values.astype(FLOAT_DTYPE)
 
     def _vicinity_processing(
         self,
@@ -555,6 +693,7 @@ class Threshold(PostProcessingPlugin):
 
         Raises:
             ValueError: Cannot apply land-mask cube without in-vicinity processing.
+            ValueError: if a fuzzy bound coincides with its threshold value.
             ValueError: if a np.nan value is detected within the input cube.
         """
         if self.vicinity is None and landmask is not None:
@@ -562,6 +701,12 @@ class Threshold(PostProcessingPlugin):
                 "Cannot apply land-mask cube without in-vicinity processing"
             )
 
+        if self._zero_range_threshold is not None:
+            raise ValueError(
+                "Cannot rescale a zero input range "
+                f"({self._zero_range_threshold} -> {self._zero_range_threshold})"
+            )
+
         if self.fill_masked is not None:
             input_cube.data = np.ma.filled(input_cube.data, self.fill_masked)
 
@@ -600,8 +745,10 @@ class Threshold(PostProcessingPlugin):
 
         for cube in input_slices:
             # Tests performed on each slice rather than whole cube to avoid
-            # realising all of the data.
-            if np.isnan(cube.data).any():
+            # realising all of the data. Any NaN present propagates into the
+            # sum, allowing detection via a single reduction of the data
+            # without allocating a boolean mask.
+            if np.isnan(np.sum(cube.data)):
                 raise ValueError("Error: NaN detected in input cube data")
 
             if np.ma.is_masked(cube.data):
@@ -617,10 +764,8 @@ class Threshold(PostProcessingPlugin):
             # dimension and our denominator will be 1 at all unmasked points.
             contribution_total += unmasked
 
-            for index, (threshold, bounds) in enumerate(
-                zip(self.thresholds, self.fuzzy_bounds)
-            ):
-                truth_value = self._calculate_truth_value(cube, threshold, bounds)
+            truth_values = self._calculate_truth_value(cube)
+            for index, truth_value in enumerate(truth_values):
                 if self.vicinity is not None:
                     self._vicinity_processing(
                         thresholded_cube,
@@ -772,7 +917,9 @@ class LatitudeDependentThreshold(Threshold):
         Raises:
             ValueError: if a np.nan value is detected within the input cube.
         """
-        if np.isnan(input_cube.data).any():
+        # Any NaN present propagates into the sum, allowing detection via a
+        # single reduction of the data without allocating a boolean mask.
+        if np.isnan(np.sum(input_cube.data)):
             raise ValueError("Error: NaN detected in input cube data")
 
         self.threshold_coord_name = input_cube.name()
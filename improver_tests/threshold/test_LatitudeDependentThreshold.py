@@ -77,11 +77,14 @@ class Test__add_latitude_threshold_coord(IrisTest):
 class Test_process(IrisTest):
     """Test the thresholding plugin."""
 
-    def setUp(self):
-        """Create a cube with a constant non-zero value spanning latitudes from -60 to +60."""
+    @classmethod
+    def setUpClass(cls):
+        """Create template cubes with a constant non-zero value spanning
+        latitudes from -60 to +60. These are built once and copied for each
+        test to avoid repeating the cube construction."""
         attributes = {"title": "UKV Model Forecast"}
         data = np.full((7, 3), fill_value=0.5, dtype=np.float32)
-        self.cube = set_up_variable_cube(
+        cls._template_cube = set_up_variable_cube(
             data,
             name="precipitation_amount",
             units="m",
@@ -92,13 +95,22 @@ class Test_process(IrisTest):
             y_grid_spacing=20,
         )
 
-        self.masked_cube = self.cube.copy()
-        data = np.copy(self.cube.data)
+        cls._masked_template_cube = cls._template_cube.copy()
+        data = np.copy(cls._template_cube.data)
         mask = np.zeros_like(data)
         data[0][0] = -32768.0
         mask[0][0] = 1
-        self.masked_cube.data = np.ma.MaskedArray(data, mask=mask)
+        cls._masked_template_cube.data = np.ma.MaskedArray(data, mask=mask)
+
+        # Shared expected data templates; tests take copies before mutating.
+        cls._ones = np.ones_like(cls._template_cube.data)
+        cls._zeros = np.zeros_like(cls._template_cube.data)
 
+    def setUp(self):
+        """Set up fresh copies of the template cubes and a plugin for
+        testing."""
+        self.cube = self._template_cube.copy()
+        self.masked_cube = self._masked_template_cube.copy()
         self.plugin = Threshold(
             lambda lat: latitude_to_threshold(lat, midlatitude=1e-6, tropics=1.0)
         )
@@ -141,118 +153,87 @@ class Test_process(IrisTest):
     def test_threshold(self):
         """Test the latitude-dependent threshold functionality.
         We expect hits in mid-latitudes and not in the tropics."""
-        expected_result_array = np.ones_like(self.cube.data)
+        expected_result_array = self._ones.copy()
         expected_result_array[2:-2][:] = 0
         result = self.plugin(self.cube)
-        self.assertArrayAlmostEqual(result.data, expected_result_array)
+        self.assertArrayEqual(result.data, expected_result_array)
 
     def test_masked_array(self):
         """Test masked array are handled correctly.
         Masked values are preserved following thresholding."""
         result = self.plugin(self.masked_cube)
+        # The expected array retains the mask so that the masked point is
+        # excluded from the comparison.
         expected_result_array = np.ones_like(self.masked_cube.data)
         expected_result_array[2:-2][:] = 0
-        self.assertArrayAlmostEqual(result.data.data, expected_result_array)
+        self.assertArrayEqual(result.data.data, expected_result_array)
         self.assertArrayEqual(result.data.mask, self.masked_cube.data.mask)
 
     def test_threshold_negative(self):
         """Repeat the test with negative numbers when the threshold is negative."""
-        expected_result_array = np.zeros_like(self.cube.data)
+        expected_result_array = self._zeros.copy()
         expected_result_array[2:-2][:] = 1
         self.cube.data = 0 - self.cube.data
         plugin = Threshold(
             lambda lat: latitude_to_threshold(lat, midlatitude=-1e-6, tropics=-1.0)
         )
         result = plugin(self.cube)
-        self.assertArrayAlmostEqual(result.data, expected_result_array)
-
-    def test_threshold_gt(self):
-        """Test equal-to values when we are in > threshold mode."""
-        expected_result_array = np.ones_like(self.cube.data)
-        expected_result_array[3][:] = 0
-        plugin = Threshold(
-            lambda lat: latitude_to_threshold(lat, midlatitude=1e-6, tropics=0.5),
-            comparison_operator=">",
-        )
-        name = "probability_of_{}_above_threshold"
-        expected_name = name.format(self.cube.name())
-        expected_attribute = "greater_than"
-
-        result = plugin(self.cube)
-        self.assertEqual(result.name(), expected_name)
-        self.assertEqual(
-            result.coord(var_name="threshold").attributes["spp__relative_to_threshold"],
-            expected_attribute,
-        )
-        self.assertArrayAlmostEqual(result.data, expected_result_array)
-
-    def test_threshold_ge(self):
-        """Test equal-to values when we are in >= threshold mode."""
-        expected_result_array = np.ones_like(self.cube.data)
-        plugin = Threshold(
-            lambda lat: latitude_to_threshold(lat, midlatitude=1e-6, tropics=0.5),
-            comparison_operator=">=",
-        )
-        name = "probability_of_{}_above_threshold"
-        expected_name = name.format(self.cube.name())
-        expected_attribute = "greater_than_or_equal_to"
-
-        result = plugin(self.cube)
-        self.assertEqual(result.name(), expected_name)
-        self.assertEqual(
-            result.coord(var_name="threshold").attributes["spp__relative_to_threshold"],
-            expected_attribute,
-        )
-        self.assertArrayAlmostEqual(result.data, expected_result_array)
-
-    def test_threshold_lt(self):
-        """Test equal-to values when we are in < threshold mode."""
-        expected_result_array = np.zeros_like(self.cube.data)
-        expected_result_array[1:-1, :] = 1
-        plugin = Threshold(
-            lambda lat: latitude_to_threshold(lat, midlatitude=0.5, tropics=1.0),
-            comparison_operator="<",
-        )
-        name = "probability_of_{}_below_threshold"
-        expected_name = name.format(self.cube.name())
-        expected_attribute = "less_than"
-        result = plugin(self.cube)
-        self.assertEqual(result.name(), expected_name)
-        self.assertEqual(
-            result.coord(var_name="threshold").attributes["spp__relative_to_threshold"],
-            expected_attribute,
-        )
-        self.assertArrayAlmostEqual(result.data, expected_result_array)
-
-    def test_threshold_le(self):
-        """Test equal-to values when we are in le threshold mode."""
-        expected_result_array = np.ones_like(self.cube.data)
-        plugin = Threshold(
-            lambda lat: latitude_to_threshold(lat, midlatitude=0.5, tropics=1.0),
-            comparison_operator="<=",
-        )
-        name = "probability_of_{}_below_threshold"
-        expected_name = name.format(self.cube.name())
-        expected_attribute = "less_than_or_equal_to"
-        result = plugin(self.cube)
-        self.assertEqual(result.name(), expected_name)
-        self.assertEqual(
-            result.coord(var_name="threshold").attributes["spp__relative_to_threshold"],
+        self.assertArrayEqual(result.data, expected_result_array)
+
+    def test_threshold_comparators(self):
+        """Test equal-to values for each of the >, >=, < and <= threshold
+        modes."""
+        expected_gt = self._ones.copy()
+        expected_gt[3][:] = 0
+        expected_lt = self._zeros.copy()
+        expected_lt[1:-1, :] = 1
+        expected_all_hits = self._ones
+
+        cases = [
+            (">", 1e-6, 0.5, "above", "greater_than", expected_gt),
+            (">=", 1e-6, 0.5, "above", "greater_than_or_equal_to", expected_all_hits),
+            ("<", 0.5, 1.0, "below", "less_than", expected_lt),
+            ("<=", 0.5, 1.0, "below", "less_than_or_equal_to", expected_all_hits),
+        ]
+        for (
+            comparison_operator,
+            midlatitude,
+            tropics,
+            relative_to,
             expected_attribute,
-        )
-        self.assertArrayAlmostEqual(result.data, expected_result_array)
+            expected_result_array,
+        ) in cases:
+            with self.subTest(comparison_operator=comparison_operator):
+                plugin = Threshold(
+                    lambda lat: latitude_to_threshold(
+                        lat, midlatitude=midlatitude, tropics=tropics
+                    ),
+                    comparison_operator=comparison_operator,
+                )
+                expected_name = "probability_of_{}_{}_threshold".format(
+                    self.cube.name(), relative_to
+                )
+                result = plugin(self.cube)
+                self.assertEqual(result.name(), expected_name)
+                self.assertEqual(
+                    result.coord(var_name="threshold").attributes[
+                        "spp__relative_to_threshold"
+                    ],
+                    expected_attribute,
+                )
+                self.assertArrayEqual(result.data, expected_result_array)
 
     def test_threshold_unit_conversion(self):
         """Test data are correctly thresholded when the threshold (mm) is given in
         units different from that of the input cube (m)."""
-        expected_result_array = np.ones_like(self.cube.data)
+        expected_result_array = self._ones.copy()
         expected_result_array[3][:] = 0
         plugin = Threshold(
             lambda lat: latitude_to_threshold(lat, midlatitude=1e-3, tropics=500.0),
             threshold_units="mm",
         )
         result = plugin(self.cube)
-        self.assertArrayAlmostEqual(result.data, expected_result_array)
+        self.assertArrayEqual(result.data, expected_result_array)
         expected_points = (
             plugin.threshold_function(self.cube.coord("latitude").points) / 1000
         )
@@ -4,12 +4,21 @@
 # See LICENSE in the root of the repository for full licensing details.
 """Unit tests for the threshold.Threshold plugin."""
 
+import importlib
+
 import numpy as np
 import pytest
 from iris.coords import CellMethod, DimCoord
 from iris.cube import Cube
 
-from improver.threshold import Threshold
+from improver.threshold import Threshold, _slow_fuzzy_truth_values
+
+numba_installed = True
+try:
+    importlib.util.find_spec("numba")
+    from improver.numba_utilities import fast_fuzzy_truth_values
+except ImportError:
+    numba_installed = False
 
 
 @pytest.mark.parametrize(
@@ -436,6 +445,33 @@ def test_expected_values(default_cube, kwargs, collapse, comparator, expected_re
                 [np.ones((3, 3), dtype=np.float32), np.zeros((3, 3), dtype=np.float32)]
             ),
         ),
+        # mixed threshold config; the first threshold has coincident fuzzy
+        # bounds and is applied deterministically, whilst the second applies
+        # a fuzzy ramp rising from 0 at 0.6 through 0.5 at 0.7 to 1 at 0.9.
+        (
+            {"threshold_config": {"0.5": [0.5, 0.5], "0.7": [0.6, 0.9]}},
+            1,
+            np.array([[0.4, 0.65], [0.75, 1.0]]),
+            np.stack(
+                [
+                    np.array([[0, 1.0], [1.0, 1.0]], dtype=np.float32),
+                    np.array([[0, 0.25], [0.625, 1.0]], dtype=np.float32),
+                ]
+            ),
+        ),
+        # mixed threshold config with masked inputs; the masked point is
+        # excluded from both the deterministic and fuzzy thresholds and the
+        # masking is retained in the output.
+        (
+            {"threshold_config": {"0.5": [0.5, 0.5], "0.7": [0.6, 0.9]}},
+            1,
+            np.ma.masked_array([[0.4, 0.65], [0.75, 1.0]], mask=[[0, 0], [1, 0]]),
+            np.ma.masked_array(
+                [[[0, 1.0], [0, 1.0]], [[0, 0.25], [0, 1.0]]],
+                mask=[[[0, 0], [1, 0]], [[0, 0], [1, 0]]],
+                dtype=np.float32,
+            ),
+        ),
         # threshold value units are specified and differ from the data; if units matches
         # the returned probabilities would be 1, but taking into account the units
         # the returned probabilities are 0.
@@ -551,6 +587,17 @@ def test_nan_handling(custom_cube):
         plugin(custom_cube)
 
 
+@pytest.mark.parametrize("n_realizations,data", [(1, np.zeros((2, 2)))])
+def test_fuzzy_zero_input_range(custom_cube):
+    """Test that an exception is raised at process time if a fuzzy bound
+    coincides with its threshold, giving a ramp segment of zero width."""
+
+    plugin = Threshold(threshold_config={"0.5": [0.5, 0.8]})
+    msg = r"Cannot rescale a zero input range \(0.5 -> 0.5\)"
+    with pytest.raises(ValueError, match=msg):
+        plugin(custom_cube)
+
+
 @pytest.mark.parametrize(
     "n_realizations,data,mask", [(1, np.zeros((2, 2)), np.zeros((2, 2)))]
 )
@@ -617,3 +664,41 @@ def test_threshold_unit_conversion(default_cube):
         == np.array([3e-5, 9.0e-05, 1e-4], dtype="float32")
     ).all()
     assert result.coord(var_name="threshold").units == "mm hr-1"
+
+
+def test_slow_fuzzy_truth_values():
+    """Test the native python fuzzy truth value calculation against a
+    known result."""
+
+    data = np.array([[4.0, 5.0], [6.0, 8.0]], dtype=np.float32)
+    thresholds = np.array([6.0])
+    lower_bounds = np.array([4.5])
+    upper_bounds = np.array([7.5])
+    expected = np.array([[[0.0, 1.0 / 6.0], [0.5, 1.0]]])
+
+    result = _slow_fuzzy_truth_values(data, thresholds, lower_bounds, upper_bounds)
+
+    assert result.shape == expected.shape
+    assert np.allclose(result, expected)
+
+
+@pytest.mark.skipif(not numba_installed, reason="numba not installed")
+@pytest.mark.parametrize("invert", [False, True])
+def test_fuzzy_truth_values_slow_vs_fast(invert):
+    """Test that the numba and native python fuzzy truth value
+    implementations give the same result for both ramp directions."""
+
+    rng = np.random.default_rng(0)
+    data = rng.random((4, 5, 5), dtype=np.float32)
+    thresholds = np.array([0.25, 0.5, 0.75])
+    lower_bounds = thresholds * 0.8
+    upper_bounds = thresholds * 1.2
+
+    result_slow = _slow_fuzzy_truth_values(
+        data, thresholds, lower_bounds, upper_bounds, invert
+    )
+    result_fast = fast_fuzzy_truth_values(
+        data.reshape(-1), thresholds, lower_bounds, upper_bounds, invert
+    ).reshape(result_slow.shape)
+
+    assert np.allclose(result_slow, result_fast, atol=1e-7)